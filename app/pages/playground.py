@@ -1,4 +1,5 @@
 from starmodel import *
+from starmodel import SQLEntity
 from fasthtml.common import *
 from monsterui.all import *
 from sqlmodel import Field
@@ -5,17 +5,32 @@ A powerful entity management system that integrates with FastHTML's dependency i
 to provide automatic entity management with scoping and real-time updates.
 """
 
+from typing import TYPE_CHECKING
+
 # Import from new organized modules while maintaining backward compatibility
-from .core import Entity, SQLEntity, event, datastar_script, DatastarPayload
+from .core import Entity, event, datastar_script, DatastarPayload
 from .persistence import (
     EntityPersistenceBackend, 
     MemoryRepo, get_memory_persistence,
-    SQLModelBackend,
     start_all_cleanup, stop_all_cleanup, configure_all_cleanup
 )
 from .app import UnitOfWork, InProcessBus
 from .ui import *
 
+if TYPE_CHECKING:
+    from .core import SQLEntity
+    from .persistence import SQLModelBackend
+
+def __getattr__(name: str):
+    """Import the SQL-backed components on first use so sqlmodel/sqlalchemy are not loaded at startup."""
+    if name == "SQLEntity":
+        from .core import SQLEntity
+        return SQLEntity
+    if name == "SQLModelBackend":
+        from .persistence import SQLModelBackend
+        return SQLModelBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 html_tags = ['A', 'P', 'I', 'B', 'H1','H2','H3','H4','H5','H6','Div','Span','Pre','Blockquote','Q','Ul','Ol','Li','Dl','Dt','Dd','Table','Thead','Tbody','Tfoot','Tr','Th','Td','Caption','Form','Label','Select','Option','Textarea','Button','Fieldset','Legend','Article','Section','Nav','Aside','Header','Footer','Main','Figure','Figcaption','Strong','Em','Mark','Code','Samp','Kbd','Var','Time','Abbr','Dfn','Sub','Sup','Audio','Video','Picture','Canvas','Details','Summary','Dialog','Script','Noscript','Template','Style','Head','Body']
 self_closing_tags = ['Area','Base','Br','Col','Embed','Hr','Img','Input','Link','Meta','Param','Source','Track','Wbr']
 case_sensitive_tags = 'A Animate AnimateMotion AnimateTransform Circle ClipPath Defs Desc Ellipse FeBlend FeColorMatrix FeComponentTransfer FeDropShadow FeComposite FeConvolveMatrix FeDiffuseLighting FeDisplacementMap FeDistantLight FeFlood FeFuncA FeFuncB FeFuncG FeFuncR FeGaussianBlur FeImage FeMerge FeMergeNode FeMorphology FeOffset FePointLight FeSpecularLighting FeSpotLight FeTile FeTurbulence Filter Font Font_face Font_face_format Font_face_name Font_face_src Font_face_uri ForeignObject G Glyph GlyphRef Hkern Image LinearGradient Marker Mask Metadata Missing_glyph Mpath Pattern RadialGradient Set Stop Switch Symbol TextPath Tref Tspan Use View Vkern' 
@@ -24,10 +39,11 @@ case_sensitive_tags = 'A Animate AnimateMotion AnimateTransform Circle ClipPath
 # Import new application service layer components
 # from .adapters.fasthtml import include_entity, register_entities, register_all_entities
 
+# SQLEntity and SQLModelBackend are left out of __all__ on purpose: a star import would
+# otherwise resolve them through __getattr__ and load sqlmodel eagerly. Import them by name.
 __all__ = [
     # Core entity components
     'Entity',
-    'SQLEntity',
     'event',
     'datastar_script',
     'DatastarPayload',
@@ -41,7 +57,6 @@ __all__ = [
     'EntityPersistenceBackend',
     'MemoryRepo',
     'get_memory_persistence',
-    'SQLModelBackend',
     'start_all_cleanup',
     'stop_all_cleanup', 
     'configure_all_cleanup',
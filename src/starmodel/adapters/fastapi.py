@@ -14,7 +14,7 @@ from fastapi.routing import APIRoute
 from starlette.requests import Request
 
 from ..app.dispatcher import Dispatcher
-from ..app.datastar import explode_datastar_params_in_request, is_datastar_request
+from ..app.datastar import explode_datastar_params_in_request, is_datastar_request_sync
 from ..app.uow import UnitOfWork
 from ..core.entity import Entity
 from ..core.events import EventInfo
@@ -26,12 +26,12 @@ class UnpackDatastar(APIRoute):
     
     def get_route_handler(self):
         original = super().get_route_handler()
+        # The endpoint is fixed per route, so resolve its entity once instead of per request
+        entity_class = getattr(self.dependant.call, '_entity_class', None)
 
         async def custom_route(request: Request):
-            if await is_datastar_request(request):
-                event_method = self.dependant.call
-                namespace = event_method._entity_class._namespace
-                await explode_datastar_params_in_request(request, namespace)
+            if entity_class is not None and is_datastar_request_sync(request):
+                await explode_datastar_params_in_request(request, entity_class._namespace)
 
             return await original(request)
 
@@ -6,9 +6,26 @@ and multi-instance coordination.
 """
 
 import asyncio
+import logging
 from abc import ABC, abstractmethod
 from typing import Callable, Awaitable, List, Dict, Any
 
+from ..core.utils import json_bytes
+
+logger = logging.getLogger(__name__)
+
+
+def event_to_bytes(event: Dict[str, Any]) -> bytes:
+    """
+    Serialize a domain event for publishing or logging.
+    
+    Args:
+        event: Event data dictionary
+        
+    Returns:
+        JSON-encoded event as bytes
+    """
+    return json_bytes(event)
 
 class EventBus(ABC):
     """Abstract base class for event buses."""
@@ -18,6 +35,16 @@ class EventBus(ABC):
         """Publish an event to all subscribers."""
         pass
     
+    async def publish_many(self, events: List[Dict[str, Any]]) -> None:
+        """Publish a batch of events in order. Override to deliver them in one round."""
+        for event in events:
+            await self.publish(event)
+    
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether publishing could reach anyone. Buses that cannot tell report True."""
+        return True
+    
     @abstractmethod
     def subscribe(self, handler: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
         """Subscribe a handler to receive events."""
@@ -53,22 +80,44 @@ class InProcessBus(EventBus):
         Args:
             event: Event data dictionary
         """
-        if not self._subscribers:
-            return
+        await self.publish_many([event])
+    
+    async def publish_many(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Publish a batch of events to all subscribers, one event at a time.
         
-        # Publish to all subscribers concurrently
-        tasks = [handler(event) for handler in self._subscribers]
+        Each event is delivered to every handler concurrently, and the next
+        event only starts once all handlers are done, so every handler sees
+        the events in the order they were collected.
+        
+        Args:
+            events: Event data dictionaries, in the order they were collected
+        """
+        if not self._subscribers or not events:
+            return
         
-        # Wait for all handlers to complete
-        # Use gather with return_exceptions=True to prevent one handler
-        # from blocking others if it raises an exception
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Publish to a snapshot of subscribers, so handlers may
+        # (un)subscribe while the events are being delivered
+        handlers = tuple(self._subscribers)
         
-        # Log any exceptions that occurred during event handling
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                # TODO: Add proper logging here
-                print(f"Event handler {i} raised exception: {result}")
+        for event in events:
+            # A single delivery needs no Task wrapping or gather bookkeeping
+            if len(handlers) == 1:
+                try:
+                    await handlers[0](event)
+                except Exception as e:
+                    logger.error("Event handler 0 raised exception: %s", e, exc_info=e)
+                continue
+            
+            # Wait for all handlers to complete
+            # Use gather with return_exceptions=True to prevent one handler
+            # from blocking others if it raises an exception
+            results = await asyncio.gather(*(handler(event) for handler in handlers), return_exceptions=True)
+            
+            # Log any exceptions that occurred during event handling
+            for i, result in enumerate(results):
+                if isinstance(result, Exception):
+                    logger.error("Event handler %d raised exception: %s", i, result, exc_info=result)
     
     def unsubscribe(self, handler: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
         """
@@ -77,13 +126,21 @@ class InProcessBus(EventBus):
         Args:
             handler: Handler function to remove
         """
-        if handler in self._subscribers:
+        # A single scan: remove() finds and deletes the first occurrence in one pass
+        try:
             self._subscribers.remove(handler)
+        except ValueError:
+            pass
     
     def clear_subscribers(self) -> None:
         """Remove all subscribers."""
         self._subscribers.clear()
     
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether any handler is currently subscribed."""
+        return bool(self._subscribers)
+    
     @property
     def subscriber_count(self) -> int:
         """Get the number of active subscribers."""
@@ -107,11 +164,11 @@ async def datastar_event_handler(event: Dict[str, Any]) -> None:
     # 2. Send SSE updates to connected clients
     # 3. Handle client targeting based on entity scope
     
-    entity_type = event.get('entity', '').split(':')[0]
-    event_name = event.get('event')
-    
-    # For now, just print the event for debugging
-    print(f"SSE Event: {entity_type}.{event_name} - {event}")
+    # For now, just log the event for debugging. The record is passed as %r so it is only
+    # formatted when emitted, and never fails on values JSON can't encode (e.g. EventInfo)
+    if logger.isEnabledFor(logging.DEBUG):
+        entity_type = event.get('entity', '').split(':')[0]
+        logger.debug("SSE Event: %s.%s - %r", entity_type, event.get('event'), event)
 
 
 # Example WebSocket handler for real-time updates
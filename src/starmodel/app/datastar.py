@@ -1,13 +1,25 @@
-import json
 from typing import Any, List, Tuple
 from starlette.requests import Request, QueryParams
 from datastar_py.fastapi import DatastarResponse, ReadSignals, read_signals
 
+from ..core.utils import json_bytes
+
+_SIGNALS_SCOPE_KEY = "starmodel.datastar_signals"
+
+def is_datastar_request_sync(request: Request) -> bool:
+    """Check if the request is a Datastar request (header lookup only, no I/O)."""
+    return "Datastar-Request" in request.headers
+
 async def is_datastar_request(request: Request) -> bool:
-    """Check if the request is a Datastar request."""
-    if "Datastar-Request" in request.headers:
-        return True
-    return False
+    """Check if the request is a Datastar request. Awaitable form of `is_datastar_request_sync`."""
+    return is_datastar_request_sync(request)
+
+async def read_signals_cached(request: Request) -> dict[str, Any] | None:
+    """`read_signals`, memoized in the ASGI scope so middleware and handlers parse the payload once."""
+    scope = request.scope
+    if _SIGNALS_SCOPE_KEY not in scope:
+        scope[_SIGNALS_SCOPE_KEY] = await read_signals(request)
+    return scope[_SIGNALS_SCOPE_KEY]
 
 def _dig(d: dict[str, Any], path: List[str]) -> dict[str, Any] | None:
     """Walk `d` following path segments; return the subtree or None."""
@@ -32,11 +44,7 @@ def _flatten_leaves(node: dict[str, Any]) -> List[Tuple[str, str]]:
 
 def _pairs_from_query(qp: QueryParams) -> List[Tuple[str, str]]:
     """Dump all key/value pairs from (possibly duplicated) QueryParams."""
-    pairs: list[tuple[str, str]] = []
-    for key in qp.keys():
-        for val in qp.getlist(key):
-            pairs.append((key, val))
-    return pairs
+    return qp.multi_items()
 
 async def explode_datastar_params_in_request(request: Request, namespace: str) -> None:
     """
@@ -49,13 +57,13 @@ async def explode_datastar_params_in_request(request: Request, namespace: str) -
     • Values are appended, not overwritten.
     • Dict values are JSON-encoded because query strings can only hold text.
     """
-    datastar = await read_signals(request)
+    datastar = await read_signals_cached(request)
     subtree = _dig(datastar, namespace.split("."))
     if subtree is None:
         return  # namespace not present – silently ignore
 
     extra: list[tuple[str, str]] = []
-    extra.append((namespace, json.dumps(subtree)))      # whole subtree
+    extra.append((namespace, json_bytes(subtree).decode()))  # whole subtree
     extra.extend(_flatten_leaves(subtree))              # every leaf key/val
 
     merged_pairs = _pairs_from_query(request.query_params) + extra
@@ -6,13 +6,17 @@ Implements the APPLICATION SERVICE LAYER pattern from clean architecture.
 """
 
 import inspect
+import weakref
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Tuple, Type, AsyncGenerator
+from operator import methodcaller
+from typing import Any, Callable, Dict, Optional, Tuple, Type, AsyncGenerator
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from fastcore.xml import FT, to_xml
 from datastar_py.fastapi import DatastarResponse
 
+from ..core.utils import json_bytes
+
 # Import Datastar SSE functionality
 try:
     from datastar_py import SSE_HEADERS
@@ -29,17 +33,37 @@ except ImportError:
         def merge_fragments(fragment, selector=None, merge_mode="morph"):
             return f"data: merge_fragments {fragment}\n\n"
 
+# The json_bytes fast path leans on datastar_py internals (consts names, SSE._send);
+# keep it separate so a datastar_py that renamed them still gets the real SSE generator
+try:
+    from datastar_py.consts import EventType, SignalsDatalineLiteral
+    _MERGE_SIGNALS_EVENT = EventType.EventTypeMergeSignals
+    _send_event = SSE._send
+
+    def _merge_signals_event(signals) -> str:
+        """Same event as SSE.merge_signals, but encoded once with json_bytes on a single data line."""
+        data_line = f"data: {SignalsDatalineLiteral} {json_bytes(signals).decode()}"
+        return _send_event(_MERGE_SIGNALS_EVENT, [data_line])
+except (ImportError, AttributeError):
+    _merge_signals_event = SSE.merge_signals
+
 from .utils import _find_p, _fix_anno, parse_form
 from ..core import DatastarPayload
 from ..core.entity import Entity
-from ..core.events import EventInfo
+from ..core.events import EventInfo, iter_events
 from ..app.uow import UnitOfWork
 from ..app.bus import InProcessBus, EventBus
-from ..app.datastar import is_datastar_request, explode_datastar_params_in_request
+from ..app.datastar import is_datastar_request_sync, explode_datastar_params_in_request, read_signals_cached
 from starlette.middleware.base import BaseHTTPMiddleware, DispatchFunction
 from starlette.types import ASGIApp
 from starlette.applications import Starlette
 
+class _JSONBytesResponse(JSONResponse):
+    """JSONResponse encoded straight to bytes by json_bytes (orjson when installed)."""
+    
+    def render(self, content: Any) -> bytes:
+        return json_bytes(content)
+
 class Dispatcher:
     """
     Base dispatcher class for handling entity event routing and execution.
@@ -67,10 +91,8 @@ class Dispatcher:
     def discover_events(self, entity_class: Type[Entity]) -> Dict[str, EventInfo]:
         """Discover all @event decorated methods on an entity class."""
         events = {}
-        # Inspect all methods on the class
-        for name in dir(entity_class):
-            method = getattr(entity_class, name)            
-            if hasattr(method, '_event_info'): events[name] = method._event_info
+        for name, method in iter_events(entity_class):
+            events[name] = method._event_info
         return events
     
     def include_entity(self, router, entity_class: Type[Entity], base_path: str = "") -> None:
@@ -109,12 +131,14 @@ class Dispatcher:
         Create a route handler function for an entity event.
         Base implementation - can be overridden by framework-specific dispatchers.        
         """
+        # The event function is fixed for the lifetime of the route, so look it up once
+        event_function = getattr(entity_class, event_name)
+        
         async def handler(*args, **kwargs):
             """Route handler that executes entity events via dispatcher."""
             try:
                 request, resolved_args, resolved_kwargs = self._resolve_args(args, kwargs) # Resolve request, args, kwargs
                 entity = entity_class.get(request)
-                event_function = getattr(entity_class, event_name)
                 new_entity, command_record = await self.call_event(entity, event_function, request, *resolved_args, **resolved_kwargs) # Execute event
                 await self.uow.commit(new_entity, command_record) # Commit changes via Unit of Work            
                 return await self.command_to_response(command_record, new_entity, request) # Convert command result to appropriate response
@@ -143,7 +167,7 @@ class Dispatcher:
 
         event_info = event_function._event_info
         # if resolved_args or resolved_kwargs:
-        if inspect.iscoroutinefunction(event_function):
+        if event_info.is_async:
             result = await event_function(entity, *resolved_args, **resolved_kwargs)
         else:
             result = event_function(entity, *resolved_args, **resolved_kwargs)        
@@ -203,7 +227,7 @@ class Dispatcher:
             Appropriate response for the web framework
         """
         # Check if this is a Datastar request
-        is_datastar = await is_datastar_request(request)
+        is_datastar = is_datastar_request_sync(request)
         if is_datastar:
             result = command_record.get('result')
             event_info = command_record.get('event_info')
@@ -219,7 +243,7 @@ class Dispatcher:
         # Check if this is an API request (accepts JSON)
         if 'application/json' in request.headers.get('accept', ''):
             # Return JSON response with entity state
-            return JSONResponse({
+            return _JSONBytesResponse({
                 'success': True,
                 'entity': entity.model_dump() if hasattr(entity, 'model_dump') else str(entity),
                 'command': command_record['event']
@@ -237,21 +261,40 @@ class Dispatcher:
     ) -> AsyncGenerator[str, None]:
         """Create Server-Sent Event stream for Datastar responses."""
         # Always send current entity signals first
-        yield SSE.merge_signals(entity.signals)
+        signals_event = _merge_signals_event(entity.signals)
         
         if hasattr(result, '__aiter__'):  # Async generator
+            yield signals_event
             async for item in result:
                 async for sse_event in self._handle_stream_item(item, entity, selector, merge_mode):
                     yield sse_event
                         
+        elif isinstance(result, (list, tuple)):  # Already-built sequence of fragments
+            # Entity state cannot change between items, so persist once and send
+            # the signals and every fragment event as a single chunk
+            self._auto_persist_entity(entity)
+            chunk = signals_event
+            for item in result:
+                fragment = self._render_fragment(item)
+                if fragment:
+                    chunk += self._create_fragment_event(fragment, selector, merge_mode)
+            yield chunk
+                        
         elif hasattr(result, '__iter__') and not isinstance(result, (str, bytes)):  # Regular generator
+            yield signals_event
             for item in result:
                 async for sse_event in self._handle_stream_item(item, entity, selector, merge_mode):
                     yield sse_event
                         
-        else:  # Single result or None
+        elif result is None:  # Nothing to render, only the entity signals
+            yield signals_event
+                        
+        else:  # Single result
+            # The whole response is known up front, so send it as a single chunk
+            chunk = signals_event
             async for sse_event in self._handle_single_result(result, selector, merge_mode):
-                yield sse_event
+                chunk += sse_event
+            yield chunk
     
     async def _handle_stream_item(
         self,
@@ -265,12 +308,15 @@ class Dispatcher:
         self._auto_persist_entity(entity)
         
         # Send updated entity signals after each yield
-        yield SSE.merge_signals(entity.signals)
+        signals_event = _merge_signals_event(entity.signals)
         
-        # Handle HTML fragments
+        # Handle HTML fragments, sent in the same chunk as the signals so each
+        # stream item costs a single write
         fragment = self._render_fragment(item)
         if fragment:
-            yield self._create_fragment_event(fragment, selector, merge_mode)
+            yield signals_event + self._create_fragment_event(fragment, selector, merge_mode)
+        else:
+            yield signals_event
     
     async def _handle_single_result(
         self,
@@ -317,20 +363,36 @@ class Dispatcher:
         """
         if not item:
             return None
-            
-        # Fall back to FastCore's to_xml for FT objects (FastHTML prefers this)
-        if hasattr(item, '__ft__') or isinstance(item, FT):
-            return to_xml(item)
+        
+        renderer = _fragment_renderer(item)
+        return renderer(item) if renderer else None
 
-        # Try .render() method for other objects
-        if hasattr(item, 'render'):
-            return item.render()
-            
-        # Handle string/bytes directly
-        if isinstance(item, (str, bytes)):
-            return str(item)
-            
-        return None
+# Renderer chosen for each fragment type, so repeated fragments skip the hasattr/isinstance chain
+# Weak keys, so dynamically created model/component classes can still be collected
+_FRAGMENT_RENDERERS: "weakref.WeakKeyDictionary[type, Optional[Callable[[Any], str]]]" = weakref.WeakKeyDictionary()
+
+def _fragment_renderer(item: Any) -> Optional[Callable[[Any], str]]:
+    """Resolve how to render `item` to an HTML string, once per concrete type."""
+    cls = type(item)
+    try:
+        return _FRAGMENT_RENDERERS[cls]
+    except KeyError:
+        pass
+    
+    # Fall back to FastCore's to_xml for FT objects (FastHTML prefers this)
+    if hasattr(item, '__ft__') or isinstance(item, FT):
+        renderer = to_xml
+    # Try .render() method for other objects
+    elif hasattr(item, 'render'):
+        renderer = methodcaller('render')
+    # Handle string/bytes directly
+    elif isinstance(item, (str, bytes)):
+        renderer = str
+    else:
+        renderer = None
+    
+    _FRAGMENT_RENDERERS[cls] = renderer
+    return renderer
 
 class DatastarMiddleware(BaseHTTPMiddleware):
 
@@ -339,7 +401,7 @@ class DatastarMiddleware(BaseHTTPMiddleware):
         self.dispatcher = dispatcher
 
     async def dispatch(self, request, call_next):
-        if await is_datastar_request(request):
+        if is_datastar_request_sync(request):
             path = request.scope["path"]
             namespace = self.dispatcher.namespace_routes.get(path, None)
             if namespace:
@@ -360,8 +422,7 @@ async def _extract_datastar_payload(request: Request) -> DatastarPayload:
     Uses the same logic as explode_datastar_params_in_request for consistency.
     """
     try:
-        from datastar_py.fastapi import read_signals
-        datastar_payload = await read_signals(request)
+        datastar_payload = await read_signals_cached(request)
         return DatastarPayload(datastar_payload)
     except Exception:
         return DatastarPayload(None)
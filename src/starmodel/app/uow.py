@@ -5,7 +5,7 @@ Manages transactions, persistence, and domain events in a coordinated way.
 Ensures consistency across repository operations and event publishing.
 """
 
-from typing import List, Dict, Any, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..core.entity import Entity
@@ -30,7 +30,8 @@ class UnitOfWork:
             bus: Event bus for publishing domain events
         """
         self.bus = bus
-        self._events: List[Dict[str, Any]] = []
+        # Allocated on first collect_event() so idle units of work carry no list
+        self._events: Optional[List[Dict[str, Any]]] = None
         self._committed = False
     
     def collect_event(self, event_data: Dict[str, Any]) -> None:
@@ -40,6 +41,8 @@ class UnitOfWork:
         Args:
             event_data: Dictionary containing event information
         """
+        if self._events is None:
+            self._events = []
         self._events.append(event_data)
     
     async def commit(self, entity: 'Entity', command_record: Dict[str, Any]) -> None:
@@ -53,9 +56,15 @@ class UnitOfWork:
         try:
             if entity.persistence_backend:
                 entity.persistence_backend.save_entity_sync(entity)            
-            self.collect_event(command_record)
             self._committed = True
-            await self._publish_events()
+            # Nobody is listening: skip building and publishing the event batch
+            if self.bus.has_subscribers:
+                self.collect_event(command_record)
+                await self._publish_events()
+            elif self._events:
+                # Drop events collected via collect_event() too, so they don't pile up
+                # on a long-lived unit of work and flood the first later subscriber
+                self._events.clear()
             
         except Exception as e:
             # TODO: Add rollback logic here
@@ -65,8 +74,11 @@ class UnitOfWork:
     
     async def _publish_events(self) -> None:
         """Publish all collected domain events to the event bus."""
-        for event in self._events:
-            await self.bus.publish(event)
+        if not self._events:
+            return
+        
+        # Hand the whole batch to the bus so it can deliver it in one round
+        await self.bus.publish_many(self._events)
         
         # Clear events after publishing
         self._events.clear()
@@ -77,7 +89,7 @@ class UnitOfWork:
         
         Note: Actual rollback implementation depends on the repository type.
         """
-        if not self._committed:
+        if not self._committed and self._events:
             self._events.clear()
             # TODO: Add repository-specific rollback logic
     
@@ -5,12 +5,23 @@ Domain layer - framework-agnostic business logic.
 Contains entities, events, and signals with no external dependencies.
 """
 
+from typing import TYPE_CHECKING
+
 from .entity import Entity, datastar_script
 from .events import event, DatastarPayload, datastar_from_queryParams
 from .signals import SignalDescriptor
-from .entity_sql import SQLEntity
 from .utils import singleton
 
+if TYPE_CHECKING:
+    from .entity_sql import SQLEntity
+
+def __getattr__(name: str):
+    """Import SQLEntity on first use so sqlmodel/sqlalchemy are not loaded at startup."""
+    if name == "SQLEntity":
+        from .entity_sql import SQLEntity
+        return SQLEntity
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "Entity", 
     "datastar_script",
@@ -18,6 +29,5 @@ __all__ = [
     "DatastarPayload", 
     "datastar_from_queryParams",
     "SignalDescriptor",
-    "SQLEntity",
     "singleton"
 ]
\ No newline at end of file
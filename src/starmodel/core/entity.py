@@ -6,7 +6,7 @@ from starlette.requests import Request
 from pydantic import BaseModel, Field, ConfigDict
 from ..persistence import MemoryRepo, EntityPersistenceBackend
 from .signals import SignalDescriptor, EventMethodDescriptor
-from .events import event
+from .events import event, iter_events
 from .mixins import EntityMixin, PersistenceMixin
 
 datastar_script = Script(src="https://cdn.jsdelivr.net/gh/starfederation/datastar@v1.0.0-beta.11/bundles/datastar.js", type="module")
@@ -68,17 +68,15 @@ class Entity(EntityMixin, PersistenceMixin, BaseModel):
         
         # Create signal descriptors for all model fields
         for field_name in cls.model_fields:
-            setattr(cls, f"S{field_name}", SignalDescriptor(field_name))
+            setattr(cls, f"S{field_name}", SignalDescriptor(field_name, cls))
         for field_name in cls.model_computed_fields:
-            setattr(cls, f"S{field_name}", SignalDescriptor(field_name))
+            setattr(cls, f"S{field_name}", SignalDescriptor(field_name, cls))
         
         # Create URL generator methods for @event decorated methods
-        for attr_name in dir(cls):
-            attr = getattr(cls, attr_name)
-            if hasattr(attr, '_event_info'):
-                # Create URL generator method that overrides the original method on the class
-                event_descriptor = EventMethodDescriptor(attr_name, cls.__name__, attr)
-                setattr(cls, attr_name, event_descriptor)
+        for attr_name, attr in iter_events(cls):
+            # Create URL generator method that overrides the original method on the class
+            event_descriptor = EventMethodDescriptor(attr_name, cls.__name__, attr)
+            setattr(cls, attr_name, event_descriptor)
     
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
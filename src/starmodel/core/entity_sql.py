@@ -8,7 +8,7 @@ from pydantic import ConfigDict
 from .mixins import EntityMixin, PersistenceMixin
 from .signals import SignalDescriptor, EventMethodDescriptor
 from ..persistence import SQLModelBackend
-from .events import event
+from .events import event, iter_events
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -37,17 +37,15 @@ class SQLEntity(EntityMixin, PersistenceMixin, SQLModel):
         
         # Create signal descriptors for all model fields
         for field_name in cls.model_fields:
-            setattr(cls, f"{field_name}_signal", SignalDescriptor(field_name))
+            setattr(cls, f"{field_name}_signal", SignalDescriptor(field_name, cls))
         for field_name in cls.model_computed_fields:
-            setattr(cls, f"{field_name}_signal", SignalDescriptor(field_name))
+            setattr(cls, f"{field_name}_signal", SignalDescriptor(field_name, cls))
         
         # Create URL generator methods for @event decorated methods
-        for attr_name in dir(cls):
-            attr = getattr(cls, attr_name)
-            if hasattr(attr, '_event_info'):
-                # Create URL generator method that overrides the original method on the class
-                url_generator = EventMethodDescriptor(attr_name, cls.__name__, attr)
-                setattr(cls, attr_name, url_generator)
+        for attr_name, attr in iter_events(cls):
+            # Create URL generator method that overrides the original method on the class
+            url_generator = EventMethodDescriptor(attr_name, cls.__name__, attr)
+            setattr(cls, attr_name, url_generator)
     
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -64,7 +62,7 @@ class SQLEntity(EntityMixin, PersistenceMixin, SQLModel):
 
     @classmethod
     def all(cls) -> List["SQLEntity"]:
-        backend = cls._persistence_backend_class()
+        backend = cls._backend()
         return backend.all_records(cls)
 
     @classmethod
@@ -82,7 +80,7 @@ class SQLEntity(EntityMixin, PersistenceMixin, SQLModel):
         as_dict: bool = False,
         fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        backend = cls._persistence_backend_class()
+        backend = cls._backend()
         return backend.search(
             cls,
             search_value=search_value,
@@ -105,7 +103,7 @@ class SQLEntity(EntityMixin, PersistenceMixin, SQLModel):
         exact_match: bool = True,
         **kwargs
     ) -> List[Dict[str, Any]]:
-        backend = cls._persistence_backend_class()
+        backend = cls._backend()
         return backend.filter(
             model=cls,
             sorting_field=sorting_field,
@@ -155,7 +153,7 @@ class SQLEntity(EntityMixin, PersistenceMixin, SQLModel):
             entity_id = id
         
         # Try to get from persistence backend
-        backend = cls._persistence_backend_class()
+        backend = cls._backend()
         cached = backend.load_entity_sync(cls, entity_id, alt_key)        
         if cached and isinstance(cached, cls):
             return cached
@@ -165,17 +163,17 @@ class SQLEntity(EntityMixin, PersistenceMixin, SQLModel):
     
     @classmethod
     def update_record(cls, id: Any, data: Dict[str, Any]) -> Dict[str, Any]:
-        backend = cls._persistence_backend_class()
+        backend = cls._backend()
         return backend.update_record(cls, id, data)
 
     @classmethod
     def delete_record(cls, id: Any) -> None:
-        backend = cls._persistence_backend_class()
+        backend = cls._backend()
         return backend.delete_record(cls, id)
 
     @classmethod
     def upsert(cls, data: Dict[str, Any]) -> "SQLEntity":
-        backend = cls._persistence_backend_class()
+        backend = cls._backend()
         return backend.upsert_record(cls, data)
 
     @classmethod
@@ -9,11 +9,13 @@ This is the refactored version as specified in app-layer.md.
 
 import inspect
 from dataclasses import dataclass, field
-from typing import Optional, Any, Dict, Type, TypeVar
+from typing import Optional, Any, Dict, Iterator, Tuple, Type, TypeVar
+
+from .utils import json_loads
 
 T = TypeVar('T')
 
-@dataclass
+@dataclass(slots=True)
 class EventInfo:
     """Metadata about an event method stored by the @event decorator."""
     name: str
@@ -26,6 +28,7 @@ class EventInfo:
     namespace: Optional[str] = None
     entity_class: Optional[Type[T]] = None
     kwargs: dict = field(default_factory=dict)
+    is_async: bool = False
 
 
 class DatastarPayload:
@@ -96,7 +99,8 @@ def event(
             signature=inspect.signature(func), # Event method signature
             path=path, # Custom path for the route
             include_in_schema=include_in_schema, # Whether to include in API schema
-            kwargs=kwargs # Additional keyword arguments
+            kwargs=kwargs, # Additional keyword arguments
+            is_async=inspect.iscoroutinefunction(func) # Resolved once instead of on every dispatch
         )
         return func
     
@@ -107,17 +111,33 @@ def event(
     return decorator
 
 
+def iter_events(cls: type) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield `(name, method)` for every @event method defined on `cls` or its bases.
+    
+    Walks each class `__dict__` along the MRO instead of `dir()` + `getattr`,
+    so only declared attributes are visited. The most-derived definition wins,
+    and inherited event descriptors are unwrapped to their original method.
+    """
+    seen = set()
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if hasattr(attr, '_event_info'):
+                yield name, getattr(attr, 'original_method', attr)
+
+
 # Legacy compatibility - keep the old DatastarPayload extraction functions
 # These will be moved to the dispatcher in a future cleanup
 
 def datastar_from_queryParams(request) -> DatastarPayload:
     """Extract Datastar payload from request query params only."""
-    import json
-    
     try:
         datastar_json_str = request.query_params.get('datastar')
         if datastar_json_str:
-            data = json.loads(datastar_json_str)
+            data = json_loads(datastar_json_str)
             return DatastarPayload(data)
     except Exception:
         pass
@@ -6,12 +6,15 @@ mixed into any base model class (BaseModel, SQLModel, etc.).
 """
 
 import asyncio
-import json
 from typing import Any, Dict, Optional
 
 from fastcore.xml import *
 from starlette.requests import Request
 from ...persistence import MemoryRepo
+from ..events import datastar_from_queryParams
+from ..utils import json_bytes
+
+_MISSING = object()
 
 
 class EntityMixin:
@@ -53,7 +56,16 @@ class EntityMixin:
     def persistence_backend(self):
         """Get the persistence backend for this entity instance."""
         # Lazy initialization to avoid pickling issues
-        return self._persistence_backend_class()
+        return self._backend()
+    
+    @classmethod
+    def _backend(cls):
+        """Get the persistence backend instance for this entity class.
+
+        Backends own their lifetime (MemoryRepo and SQLModelBackend are singletons),
+        so this just instantiates the configured class.
+        """
+        return cls._persistence_backend_class()
     
     @property
     def signals(self) -> Dict[str, Any]:
@@ -73,17 +85,32 @@ class EntityMixin:
 
     def set_from_request(self, req: Request, **kwargs) -> 'EntityMixin':
         """Initialize entity instance with Datastar payload."""
-        # Import here to avoid circular dependency
-        from ..events import datastar_from_queryParams
         datastar = datastar_from_queryParams(req)    
-        for f in self.__class__.model_fields.keys():      
-            fns = self.__class__.__name__ + "." + f  
+        current = self.__dict__
+        for f, fns in self._payload_keys():
             if f in datastar:
-                setattr(self, f, datastar[f])
+                value = datastar[f]
             elif fns in datastar:
-                setattr(self, f, datastar[fns])
+                value = datastar[fns]
+            else:
+                continue
+            # Skip validated assignment when the client sent back the value we already hold;
+            # the type check keeps 1 / 1.0 / True from masking a type change
+            old = current.get(f, _MISSING)
+            if old is value or (type(old) is type(value) and old == value):
+                continue
+            setattr(self, f, value)
         return self
     
+    @classmethod
+    def _payload_keys(cls) -> tuple:
+        """Cached `(field, "Class.field")` pairs used to read fields from a Datastar payload."""
+        keys = cls.__dict__.get('_payload_keys_cache')
+        if keys is None:
+            keys = tuple((f, f"{cls.__name__}.{f}") for f in cls.model_fields)
+            cls._payload_keys_cache = keys
+        return keys
+    
     def _sync_from_client(self, req: Request):
         """Sync entity with client-side changes using datastar payload."""
         if req and self.sync_with_client:
@@ -114,7 +141,7 @@ class EntityMixin:
     
     def __ft__(self):
         """Render with data-signals attributes."""
-        signals = json.dumps(self.signals)
+        signals = json_bytes(self.signals).decode()
         return Div(**{"data-signals": signals}, id=f"{self.namespace}")
 
     # Default event methods that subclasses can override
@@ -38,7 +38,7 @@ class PersistenceMixin:
         
         # Try to get from persistence backend
         if hasattr(cls, '_persistence_backend_class'):
-            backend = cls._persistence_backend_class()
+            backend = cls._backend()
             cached = backend.load_entity_sync(entity_id)        
             if cached and isinstance(cached, cls):
                 return cached
@@ -1,31 +1,77 @@
+import inspect
+import sys
+from types import MethodType
+
+# FastHTML-injected parameters and annotation types that never map to URL query params
+_SPECIAL_PARAMS = frozenset({'session', 'auth', 'request', 'htmx', 'scope', 'app', 'datastar'})
+_SPECIAL_ANNOTATIONS = frozenset({'Request', 'HtmxHeaders', 'Starlette', 'DatastarPayload'})
 
 # TODO: add `S` prefix to the signal and make it a class variable
 class SignalDescriptor:
     """Return `$Model.field` on the class, real value on an instance."""
 
-    def __init__(self, field_name: str) -> None:
+    __slots__ = ('field_name', '_signal_name')
+
+    def __init__(self, field_name: str, owner=None) -> None:
         self.field_name = field_name
+        # Resolved up front when the owner is known, so class access is a single load
+        self._signal_name = self._resolve_signal_name(owner) if owner is not None else None
+
+    def _resolve_signal_name(self, owner) -> str:
+        config = getattr(owner, "model_config", {})
+        ns = config.get("namespace", owner.__name__)
+        use_ns = config.get("use_namespace", False)
+        # Interned so every reference to a signal name shares one string object
+        return sys.intern(f"${ns}.{self.field_name}" if use_ns else f"${self.field_name}")
 
     def __get__(self, instance, owner):
         #  class access  →  owner is the model class, instance is None
         if instance is None:
-            config = getattr(owner, "model_config", {})
-            ns = config.get("namespace", owner.__name__)
-            use_ns = config.get("use_namespace", False)
-            return f"${ns}.{self.field_name}" if use_ns else f"${self.field_name}"
+            name = self._signal_name
+            if name is None:
+                name = self._signal_name = self._resolve_signal_name(owner)
+            return name
 
-        #  instance access  →  behave like a normal attribute
-        return instance.__dict__[self.field_name]
+        #  instance access  →  behave like a normal attribute; computed fields are
+        #  properties with no `__dict__` entry, so read them through the class
+        try:
+            return instance.__dict__[self.field_name]
+        except KeyError:
+            return getattr(instance, self.field_name)
 
 class EventMethodDescriptor:
     """Generate URL strings for @event methods to use with Datastar, but allow direct execution."""
     
+    __slots__ = ('method_name', 'entity_class_name', 'original_method', '_event_info', 'param_names', 'http_method', 'path')
+    
     def __init__(self, method_name: str, entity_class_name: str, original_method):
         self.method_name = method_name
         self.entity_class_name = entity_class_name
         self.original_method = original_method
         # Preserve the original event info
         self._event_info = getattr(original_method, '_event_info', None)
+        # Resolve the URL-mappable parameter names once instead of on every URL build
+        self.param_names = self._url_param_names()
+        # The HTTP verb and route path are fixed per event, so build them once
+        self.http_method = self._event_info.method.lower() if self._event_info else "get"
+        self.path = f"/{entity_class_name.lower()}/{method_name}"
+    
+    def _url_param_names(self) -> tuple:
+        """Parameter names that map positional args to query params, skipping FastHTML special params."""
+        if not (self._event_info and self._event_info.signature):
+            return ()
+        param_names = []
+        for name, param in list(self._event_info.signature.parameters.items())[1:]:  # Skip 'self'
+            # Skip FastHTML special parameters that get auto-injected
+            if name.lower() not in _SPECIAL_PARAMS:
+                # Also skip if annotation indicates it's a special FastHTML type
+                anno = param.annotation
+                if anno != inspect.Parameter.empty:
+                    if hasattr(anno, '__name__'):
+                        if anno.__name__ in _SPECIAL_ANNOTATIONS:
+                            continue
+                param_names.append(name)
+        return tuple(param_names)
     
     def __get__(self, instance, owner):
         """Handle descriptor access - return bound method for instances, self for class access."""
@@ -34,8 +80,7 @@ class EventMethodDescriptor:
             return self
         else:
             # Accessed on instance - return bound method for execution
-            import functools
-            return functools.partial(self.original_method, instance)
+            return MethodType(self.original_method, instance)
     
     def __call__(self, *args, **kwargs):
         """Generate URL strings for Datastar OR execute the original method."""
@@ -46,40 +91,12 @@ class EventMethodDescriptor:
         
         # Otherwise, generate URL string for Datastar
         import urllib.parse
-        import inspect
-        
-        # Get HTTP method from event info
-        http_method = "get"  # default
-        if self._event_info:
-            http_method = self._event_info.method.lower()
-        
-        # Build the path
-        path = f"/{self.entity_class_name.lower()}/{self.method_name}"
         
         # Build query parameters from args and kwargs
         params = {}
         
-        # Get parameter names from method signature, filtering out FastHTML special params
-        if self._event_info and self._event_info.signature:
-            sig = self._event_info.signature
-            param_names = []
-            special_params = {'session', 'auth', 'request', 'htmx', 'scope', 'app', 'datastar'}
-            
-            for name, param in list(sig.parameters.items())[1:]:  # Skip 'self'
-                # Skip FastHTML special parameters that get auto-injected
-                if name.lower() not in special_params:
-                    # Also skip if annotation indicates it's a special FastHTML type
-                    anno = param.annotation
-                    if anno != inspect.Parameter.empty:
-                        if hasattr(anno, '__name__'):
-                            if anno.__name__ in ('Request', 'HtmxHeaders', 'Starlette', 'DatastarPayload'):
-                                continue
-                    param_names.append(name)
-            
-            # Add positional arguments mapped to parameter names
-            for i, arg in enumerate(args):
-                if i < len(param_names):
-                    params[param_names[i]] = arg
+        # Add positional arguments mapped to the precomputed parameter names
+        params.update(zip(self.param_names, args))
         
         # Add keyword arguments (filter out None values)
         params.update({k: v for k, v in kwargs.items() if v is not None})
@@ -87,6 +104,6 @@ class EventMethodDescriptor:
         # Build query string
         if params:
             query_string = urllib.parse.urlencode(params, doseq=True)
-            return f"@{http_method}('{path}?{query_string}')"
+            return f"@{self.http_method}('{self.path}?{query_string}')"
         else:
-            return f"@{http_method}('{path}')"
+            return f"@{self.http_method}('{self.path}')"
@@ -1,4 +1,15 @@
-from typing import TypeVar, Type
+import json
+from dataclasses import fields, is_dataclass
+from datetime import date
+from enum import Enum
+from functools import singledispatch
+from typing import Any, TypeVar, Type
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib encoder
+    orjson = None
 
 T = TypeVar('T')
 
@@ -10,4 +21,49 @@ def singleton(cls: Type[T]) -> Type[T]:
             instances[cls] = cls(*args, **kwargs)
         return instances[cls]
 
-    return get_instance
\ No newline at end of file
+    return get_instance
+
+
+@singledispatch
+def _json_default(obj: Any) -> Any:
+    """Encode values the JSON backend does not handle natively."""
+    if isinstance(obj, type):
+        raise TypeError(f"Class {obj.__name__} is not JSON serializable")
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+@_json_default.register
+def _(obj: Enum) -> Any:
+    return obj.value
+
+@_json_default.register
+def _(obj: date) -> str:
+    # Also covers datetime, which subclasses date
+    return obj.isoformat()
+
+@_json_default.register
+def _(obj: UUID) -> str:
+    # orjson encodes UUIDs natively; match it on the stdlib path
+    return str(obj)
+
+
+def json_bytes(obj: Any) -> bytes:
+    """Serialize `obj` to compact UTF-8 JSON bytes, using orjson when it is installed.
+
+    Both paths emit the same bytes for JSON-native values, str/int/float/bool/None keys
+    and the types `_json_default` handles. They still differ on NaN/Infinity and on
+    non-str keys of other types (date, UUID, ...), which only orjson accepts.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,19 +5,23 @@ Infrastructure adapters for different storage backends.
 Implements the persistence ports defined in the core domain.
 """
 
-from typing import List
+import weakref
+from typing import TYPE_CHECKING
+
 from .base import EntityPersistenceBackend
 from .memory import MemoryRepo, get_memory_persistence
 from .datastar import DatastarRepo
-from .sql import SQLModelBackend
 
-# Global registry of active persistence backends for cleanup management
-_active_backends: List[EntityPersistenceBackend] = []
+if TYPE_CHECKING:
+    from .sql import SQLModelBackend
+
+# Global registry of active persistence backends for cleanup management.
+# Weak references only: the registry must not keep a discarded backend alive.
+_active_backends: "weakref.WeakSet[EntityPersistenceBackend]" = weakref.WeakSet()
 
 def register_backend(backend: EntityPersistenceBackend) -> None:
     """Register a persistence backend for global cleanup management."""
-    if backend not in _active_backends:
-        _active_backends.append(backend)
+    _active_backends.add(backend)
 
 def start_all_cleanup() -> None:
     """Start cleanup tasks for all registered backends."""
@@ -34,6 +38,13 @@ def configure_all_cleanup(enabled: bool = True, interval: int = 300) -> None:
     for backend in _active_backends:
         backend.configure_cleanup(enabled, interval)
 
+def __getattr__(name: str):
+    """Import the SQL backend on first use so sqlalchemy is not loaded at startup."""
+    if name == "SQLModelBackend":
+        from .sql import SQLModelBackend
+        return SQLModelBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "EntityPersistenceBackend", 
     "MemoryRepo",
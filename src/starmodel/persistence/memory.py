@@ -4,8 +4,9 @@ StarModel Persistence Layer - Memory Backend
 In-memory entity persistence implementation for development and testing.
 """
 
+import heapq
 import time
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 
 from .base import EntityPersistenceBackend
 
@@ -35,7 +36,10 @@ class MemoryRepo(EntityPersistenceBackend):
         if not self._initialized:
             # Initialize data storage
             self._data: Dict[str, Dict[str, Any]] = {}
+            # Expiry deadlines on the monotonic clock, immune to wall-clock jumps
             self._expiry: Dict[str, float] = {}
+            # Min-heap of (deadline, key); stale entries are skipped when popped
+            self._expiry_heap: List[Tuple[float, str]] = []
             MemoryRepo._initialized = True
             
             # Initialize parent class for cleanup functionality
@@ -55,7 +59,9 @@ class MemoryRepo(EntityPersistenceBackend):
             key = entity.id
             self._data[key] = entity            
             if ttl:
-                self._expiry[key] = time.time() + ttl
+                deadline = time.monotonic() + ttl
+                self._expiry[key] = deadline
+                heapq.heappush(self._expiry_heap, (deadline, key))
             elif key in self._expiry:
                 del self._expiry[key]
             
@@ -69,7 +75,7 @@ class MemoryRepo(EntityPersistenceBackend):
         """Load entity from memory."""
         try:
             # Check if expired
-            if key in self._expiry and time.time() > self._expiry[key]:
+            if key in self._expiry and time.monotonic() > self._expiry[key]:
                 self._data.pop(key, None)
                 self._expiry.pop(key, None)
                 return None
@@ -96,7 +102,7 @@ class MemoryRepo(EntityPersistenceBackend):
         """Check if entity exists in memory."""
         try:
             # Check if expired
-            if key in self._expiry and time.time() > self._expiry[key]:
+            if key in self._expiry and time.monotonic() > self._expiry[key]:
                 self._data.pop(key, None)
                 self._expiry.pop(key, None)
                 return False
@@ -110,17 +116,21 @@ class MemoryRepo(EntityPersistenceBackend):
     def cleanup_expired_sync(self) -> int:
         """Clean up expired entity entries from memory."""
         try:
-            current_time = time.time()
-            expired_keys = [
-                key for key, expiry_time in self._expiry.items()
-                if current_time > expiry_time
-            ]
+            current_time = time.monotonic()
+            heap = self._expiry_heap
+            cleaned = 0
             
-            for key in expired_keys:
+            # Only pop deadlines that have passed instead of scanning every TTL entry
+            while heap and heap[0][0] < current_time:
+                deadline, key = heapq.heappop(heap)
+                # Skip entries superseded by a later save or removed by delete/load
+                if self._expiry.get(key) != deadline:
+                    continue
                 self._data.pop(key, None)
                 self._expiry.pop(key, None)
+                cleaned += 1
             
-            return len(expired_keys)
+            return cleaned
             
         except Exception as e:
             print(f"Error cleaning up expired entities: {e}")
@@ -28,6 +28,8 @@ class SQLModelBackend(EntityPersistenceBackend):
             
             # Initialize parent class for cleanup functionality
             super().__init__()
+            # Rows carry no TTL, so a periodic cleanup task would only wake up to do nothing
+            self._auto_cleanup = False
             self.engine = create_engine(url, echo=echo)
             
             # NOTE: Table creation moved to configure_app() to ensure proper initialization order
@@ -80,9 +82,11 @@ class SQLModelBackend(EntityPersistenceBackend):
         exact_match: bool = True,
         **kwargs
     ) -> List[Dict[str, Any]]:
+        # Loop invariant: resolve the field map once instead of per kwarg
+        model_fields = model.model_fields
         with Session(self.engine) as session:
             # Validate that all filter fields exist in the model
-            invalid_fields = [field for field in kwargs.keys() if field not in model.__fields__]
+            invalid_fields = [field for field in kwargs.keys() if field not in model_fields]
             if invalid_fields:
                 raise ValueError(f"Invalid fields for filtering: {', '.join(invalid_fields)}")
 
@@ -94,38 +98,39 @@ class SQLModelBackend(EntityPersistenceBackend):
 
             # Add filters for each kwarg
             for field, value in kwargs.items():
+                column = getattr(model, field)
                 if value is None:
-                    query = query.filter(getattr(model, field).is_(None))
+                    query = query.filter(column.is_(None))
                     continue
 
-                field_type = model.__fields__[field].annotation
+                field_type = model_fields[field].annotation
                 # Get the underlying type if it's Optional
                 if get_origin(field_type) is Union:
                     # Optional[T] is actually Union[T, None]
                     field_type = next((t for t in get_args(field_type) if t is not type(None)), str)
 
                 if not exact_match and isinstance(value, str):
-                    query = query.filter(getattr(model, field).ilike(f"%{value}%"))
+                    query = query.filter(column.ilike(f"%{value}%"))
                 else:
                     # Handle different field types
                     if field_type in (str, Optional[str]):
                         if exact_match:
-                            query = query.filter(getattr(model, field) == value)
+                            query = query.filter(column == value)
                         else:
-                            query = query.filter(getattr(model, field).ilike(f"%{value}%"))
+                            query = query.filter(column.ilike(f"%{value}%"))
                     
                     elif field_type in (int, float, Decimal, bool, Optional[int], Optional[float], Optional[Decimal], Optional[bool]):
-                        query = query.filter(getattr(model, field) == value)
+                        query = query.filter(column == value)
                     
                     elif field_type in (datetime, date, Optional[datetime], Optional[date]):
                         # Handle date/datetime range queries
                         if isinstance(value, (list, tuple)) and len(value) == 2:
                             start, end = value
                             query = query.filter(
-                                getattr(model, field).between(start, end)
+                                column.between(start, end)
                             )
                         else:
-                            query = query.filter(getattr(model, field) == value)
+                            query = query.filter(column == value)
                     elif field_type is UUID:
                         # Handle UUID fields, converting string to UUID if needed
                         if isinstance(value, str):
@@ -133,19 +138,19 @@ class SQLModelBackend(EntityPersistenceBackend):
                                 value = UUID(value)
                             except ValueError:
                                 raise ValueError(f"Invalid UUID format for field {field}: {value}")
-                        query = query.filter(getattr(model, field) == value)
+                        query = query.filter(column == value)
                     
                     elif isinstance(value, (list, tuple)):
                         # Handle IN queries for lists
-                        query = query.filter(getattr(model, field).in_(value))
+                        query = query.filter(column.in_(value))
                     
                     else:
                         # Default to exact match for unknown types
-                        query = query.filter(getattr(model, field) == value)
+                        query = query.filter(column == value)
 
             # Add sorting
             if sorting_field:
-                if sorting_field in model.__fields__:
+                if sorting_field in model_fields:
                     order_field = getattr(model, sorting_field)
                     query = query.order_by(
                         order_field.desc()
@@ -183,6 +188,7 @@ class SQLModelBackend(EntityPersistenceBackend):
         as_dict: bool = False,
         fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
+        model_fields = model.model_fields
         with Session(self.engine) as session:
             if fields:
                 query = select(*[getattr(model, field) for field in fields])
@@ -191,7 +197,7 @@ class SQLModelBackend(EntityPersistenceBackend):
 
             if search_value:
                 string_fields = [
-                    k for k, v in model.__fields__.items() if v.annotation is str
+                    k for k, v in model_fields.items() if v.annotation is str
                 ]
                 if string_fields:
                     conditions = [
@@ -201,7 +207,7 @@ class SQLModelBackend(EntityPersistenceBackend):
                     query = query.filter(or_(*conditions))
 
             if sorting_field:
-                if sorting_field in model.__fields__:
+                if sorting_field in model_fields:
                     order_field = getattr(model, sorting_field)
                     query = query.order_by(
                         order_field.desc()
@@ -306,10 +312,18 @@ class SQLModelBackend(EntityPersistenceBackend):
 
     def bulk_update(self, model: Type[SQLModel], data: List[Dict[str, Any]]) -> List[SQLModel]:
         with Session(self.engine) as session:
+            # Fetch all targeted rows in a single IN query instead of one get() per item
+            ids = [item["id"] for item in data if "id" in item]
+            existing = {}
+            if ids:
+                existing = {r.id: r for r in session.exec(select(model).where(model.id.in_(ids))).all()}
             records = []
             for item in data:
                 if "id" in item:
-                    record = session.get(model, item["id"])
+                    record = existing.get(item["id"])
+                    if record is None:
+                        # Raw dict lookup misses ids needing coercion (e.g. "1" for an int key)
+                        record = session.get(model, item["id"])
                     if record:
                         for key, value in item.items():
                             setattr(record, key, value)
@@ -1,21 +1,30 @@
 import importlib
-from functools import cached_property
+from functools import cache, cached_property, lru_cache
 from typing import Any, Mapping
 
 from fastapi import Response
 
 from .fastcore_utils import partition, risinstance
 
+try:
+    from markupsafe import escape as _escape
+except ImportError:  # markupsafe ships with jinja2; fall back to the stdlib escaper
+    from html import escape as _html_escape
+    def _escape(v): return _html_escape(str(v))
+
 html_tags = ['A', 'P', 'I', 'B', 'H1','H2','H3','H4','H5','H6','Div','Span','Pre','Blockquote','Q','Ul','Ol','Li','Dl','Dt','Dd','Table','Thead','Tbody','Tfoot','Tr','Th','Td','Caption','Form','Label','Select','Option','Textarea','Button','Fieldset','Legend','Article','Section','Nav','Aside','Header','Footer','Main','Figure','Figcaption','Strong','Em','Mark','Code','Samp','Kbd','Var','Time','Abbr','Dfn','Sub','Sup','Audio','Video','Picture','Canvas','Details','Summary','Dialog','Script','Noscript','Template','Style','Head','Body']
 self_closing_tags = ['Area','Base','Br','Col','Embed','Hr','Img','Input','Link','Meta','Param','Source','Track','Wbr']
 case_sensitive_tags = 'A Animate AnimateMotion AnimateTransform Circle ClipPath Defs Desc Ellipse FeBlend FeColorMatrix FeComponentTransfer FeDropShadow FeComposite FeConvolveMatrix FeDiffuseLighting FeDisplacementMap FeDistantLight FeFlood FeFuncA FeFuncB FeFuncG FeFuncR FeGaussianBlur FeImage FeMerge FeMergeNode FeMorphology FeOffset FePointLight FeSpecularLighting FeSpotLight FeTile FeTurbulence Filter Font Font_face Font_face_format Font_face_name Font_face_src Font_face_uri ForeignObject G Glyph GlyphRef Hkern Image LinearGradient Marker Mask Metadata Missing_glyph Mpath Pattern RadialGradient Set Stop Switch Symbol TextPath Tref Tspan Use View Vkern' 
 
 _specials = set('@.-!~:[](){}$%^&*+=|/?<>,`')
+_is_mapping = risinstance(Mapping)
+_attr_aliases = dict(htmlClass='class', cls='class', _class='class', klass='class',
+                     _for='for', fr='for', htmlFor='for')
 
+@lru_cache(maxsize=1024)
 def attrmap(o):
-    if _specials & set(o): return o
-    o = dict(htmlClass='class', cls='class', _class='class', klass='class',
-             _for='for', fr='for', htmlFor='for').get(o, o)
+    if not _specials.isdisjoint(o): return o
+    o = _attr_aliases.get(o, o)
     return o if o=='_' else o.lstrip('_').replace('_', '-')
 
 
@@ -27,7 +36,7 @@ class Tag:
         the values of these attributes, the object reconstruction can't occur"""
         self._name = self.__class__.__name__
         self._module = self.__class__.__module__
-        ds,c = partition(args, risinstance(Mapping))
+        ds,c = partition(args, _is_mapping)
         for d in ds: kwargs = {**kwargs, **d}
         self._children = c
         self._attrs = kwargs
@@ -44,7 +53,7 @@ class Tag:
     def attrs(self) -> str:
         if not self._attrs:
             return ""
-        return " " + " ".join(f'{attrmap(k)}="{v}"' for k, v in self._attrs.items())
+        return " " + " ".join(f'{attrmap(k)}="{_escape(v)}"' for k, v in self._attrs.items())
 
     @cached_property
     def children(self):
@@ -53,7 +62,8 @@ class Tag:
         )
 
     def __repr__(self):
-        return f"<{self.name}{self.attrs}>{self.children}</{self.name}>"
+        name = self.name
+        return f"<{name}{self.attrs}>{self.children}</{name}>"
     
     def __str__(self):
         return self.__repr__()
@@ -89,7 +99,7 @@ class Html(Tag):
     def bodykws(self) -> str:
         if not self._bodykws:
             return ""
-        return " " + " ".join(f'{attrmap(k)}="{v}"' for k, v in self._bodykws.items())
+        return " " + " ".join(f'{attrmap(k)}="{_escape(v)}"' for k, v in self._bodykws.items())
     
     @cached_property
     def footers(self):
@@ -130,10 +140,6 @@ class RawHTML(Tag):
 
 for class_name in html_tags + self_closing_tags:
     new_class = type(class_name, (Tag,), {
-        '__init__': Tag.__init__,
-        '__repr__': Tag.__repr__, 
-        '__str__': Tag.__str__,
-        '_repr_html_': Tag._repr_html_,
         '__doc__': f"""Object that represents `<{class_name}>` HTML element.""",
         '_name': class_name
     })
@@ -141,22 +147,22 @@ for class_name in html_tags + self_closing_tags:
 
 for class_name in case_sensitive_tags.split():
     new_class = type(class_name, (CaseTag,), {
-        '__init__': CaseTag.__init__,
-        '__repr__': CaseTag.__repr__, 
-        '__str__': CaseTag.__str__,
-        '_repr_html_': CaseTag._repr_html_,
         '__doc__': f"""Object that represents `<{class_name}>` HTML element.""",
         '_name': class_name
     })  
     globals()[class_name] = new_class
 
+@cache
+def _component_class(module_name: str, name: str):
+    """Resolve a serialized component's class once per (module, name) pair."""
+    return getattr(importlib.import_module(module_name), name)
+
 def dict_to_ft_component(d):
     children_raw = d.get("_children", ())
     children = tuple(
         dict_to_ft_component(c) if isinstance(c, dict) else c for c in children_raw
     )
-    module = importlib.import_module(d["_module"])
-    obj = getattr(module, d["_name"])
+    obj = _component_class(d["_module"], d["_name"])
     return obj(*children, **d.get("_attrs", {}))
 
 
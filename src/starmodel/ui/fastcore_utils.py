@@ -37,15 +37,19 @@ def tuplify(o, use_list=False, match=None):
     "Make `o` a tuple"
     return tuple(listify(o, use_list=use_list, match=match))
 
+def _risinstance_names(types, obj): return any(t.__name__ in types for t in type(obj).__mro__)
+
 def _risinstance(types, obj):
-    if any(isinstance(t,str) for t in types):
-        return any(t.__name__ in types for t in type(obj).__mro__)
+    if any(isinstance(t,str) for t in types): return _risinstance_names(types, obj)
     return isinstance(obj, types)
 
 def risinstance(types, obj=None):
     "Curried `isinstance` but with args reversed"
     types = tuplify(types)
-    if obj is None: return partial(_risinstance,types)
+    if obj is None:
+        # Decide name- vs type-matching once at curry time rather than on every call
+        if any(isinstance(t,str) for t in types): return partial(_risinstance_names,types)
+        return lambda o: isinstance(o, types)
     return _risinstance(types, obj)
     
 def partition(coll, f):